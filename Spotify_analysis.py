@@ -23,63 +23,278 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import argparse
+import bisect
 import sys
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None  # Optional fast CSV path; we fall back to pandas
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None  # Optional SQL engine; aggregations fall back to pandas
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None  # Optional Rust CSV engine; load falls back to pyarrow/pandas
+
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+
+# Listening personality, indexable by peak hour (0-23) — one load, no branches
+HOUR_PERSONALITY = ([("Night owl listener", "🌙")] * 5
+                    + [("Morning music person", "🌅")] * 7
+                    + [("Afternoon listener", "☀️")] * 5
+                    + [("Evening music lover", "🌆")] * 5
+                    + [("Night owl listener", "🌙")] * 2)
+
+# Average daily plays → listening intensity, indexed via bisect on the thresholds
+INTENSITY_THRESHOLDS = (20, 50)
+INTENSITY_LEVELS = (("selective listener", "🎶"),
+                    ("moderate listener", "🎵"),
+                    ("heavy listener", "🎧"))
+
+# Columns the analyzers actually touch (Spotify extended streaming history schema)
+USED_COLUMNS = [
+    'ts',
+    'master_metadata_track_name',
+    'master_metadata_album_artist_name',
+    'master_metadata_album_album_name',
+    'reason_start',
+    'reason_end',
+    'skipped',
+]
+
+# Repetitive string columns worth dictionary-encoding at parse time
+CATEGORICAL_COLUMNS = {
+    'master_metadata_track_name',
+    'master_metadata_album_artist_name',
+    'master_metadata_album_album_name',
+    'reason_start',
+    'reason_end',
+}
+
 
 class SpotifyKnowledgeMapper:
     """Main class for analyzing Spotify listening patterns."""
     
-    def __init__(self, data_path=None, kaggle_mode=False):
+    def __init__(self, data_path=None, kaggle_mode=False, interactive=False):
         """Initialize the analyzer with data path or Kaggle mode."""
         self.kaggle_mode = kaggle_mode
         self.data_path = data_path
+        self.interactive = interactive
         self.df = None
         self.insights = []
+        self._con = None
+        self._hist = None
+        self._daily = None
+        self._hour = None
+        self._dow = None
+        self._month = None
+        self._day_idx = None
+        self._first_day = None
+        self._sections = {}
+        self._lock = threading.RLock()
         
     def load_data(self):
         """Load Spotify data from file or Kaggle input."""
         print("🎵 Loading Spotify data...")
         
         if self.kaggle_mode:
-            # Kaggle paths
-            try:
-                self.df = pd.read_csv('/kaggle/input/top-spotify-songs-in-countries/spotify_history.csv')
-                print(f"✅ Loaded {len(self.df):,} listening records from Kaggle")
-            except FileNotFoundError:
-                print("❌ Kaggle input file not found. Please upload your Spotify data.")
-                return False
+            path = '/kaggle/input/top-spotify-songs-in-countries/spotify_history.csv'
         else:
-            # Local file path
-            try:
-                self.df = pd.read_csv(self.data_path)
-                print(f"✅ Loaded {len(self.df):,} listening records")
-            except FileNotFoundError:
-                print(f"❌ File not found: {self.data_path}")
-                return False
-                
+            path = self.data_path
+
+        try:
+            self.df = self._load_with_cache(path)
+            suffix = ' from Kaggle' if self.kaggle_mode else ''
+            print(f"✅ Loaded {len(self.df):,} listening records{suffix}")
+        except FileNotFoundError:
+            if self.kaggle_mode:
+                print("❌ Kaggle input file not found. Please upload your Spotify data.")
+            else:
+                print(f"❌ File not found: {path}")
+            return False
+
         print(f"📊 Available columns: {list(self.df.columns)}")
         return True
-        
+
+    def _load_with_cache(self, path):
+        """Load the CSV, keeping a Parquet cache beside it for re-runs.
+
+        CSV tokenization dominates load time; Parquet is columnar and
+        dictionary-encoded, so a cached re-load is typically 10-20x faster.
+        The cache is rebuilt whenever the CSV is newer, and caching is
+        best-effort — read-only input dirs (e.g. /kaggle/input) or a missing
+        parquet engine just fall back to plain CSV parsing.
+        """
+        cache = Path(path).with_suffix('.parquet')
+        try:
+            if cache.exists() and cache.stat().st_mtime >= Path(path).stat().st_mtime:
+                return pd.read_parquet(cache, engine='pyarrow')
+        except (OSError, ImportError, ValueError):
+            pass
+
+        df = None
+        if pl is not None and pacsv is not None:
+            # polars needs pyarrow for the zero-copy pandas handoff
+            try:
+                df = self._read_csv_polars(path)
+            except TypeError:
+                # collect(engine='streaming') needs a recent polars; older
+                # versions raise TypeError, so fall through to the next tier
+                df = None
+        if df is None and pacsv is not None:
+            df = self._read_csv_arrow(path)
+        elif df is None:
+            df = self._read_csv_chunked(path)
+
+        try:
+            df.to_parquet(cache, engine='pyarrow',
+                          compression='zstd', row_group_size=200_000)
+        except (OSError, ImportError, ValueError):
+            pass
+
+        return df
+
+    def _read_csv_arrow(self, path):
+        """Parse a CSV with PyArrow's multithreaded block reader.
+
+        Arrow tokenizes blocks in parallel and keeps strings dictionary-encoded,
+        so large exports parse several times faster than pd.read_csv and use
+        far less memory. Only the columns the analyzers need are materialized.
+        """
+        # Only restrict columns when the file matches the Spotify export schema
+        wanted = self._probe_columns(path)
+
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(block_size=8 << 20, use_threads=True),
+            parse_options=pacsv.ParseOptions(delimiter=','),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=wanted or None,
+                # Empty fields are null, as pd.read_csv and polars treat them
+                strings_can_be_null=True,
+                timestamp_parsers=['%Y-%m-%dT%H:%M:%SZ']
+            )
+        )
+
+        # pd.ArrowDtype needs pandas >= 2.0; on 1.x fall back to numpy-backed
+        # blocks rather than crashing — the declared pandas floor allows 1.x
+        mapper = pd.ArrowDtype if hasattr(pd, 'ArrowDtype') else None
+        return table.to_pandas(
+            types_mapper=mapper,
+            split_blocks=True,
+            self_destruct=True
+        )
+
+    def _read_csv_polars(self, path):
+        """Parse a CSV with Polars' lazy, multithreaded Rust engine.
+
+        scan_csv plus an explicit column projection lets the query optimizer
+        push the selection into the scan and stream the file block-wise, so
+        unused columns are never even tokenized. The collected frame is
+        handed back to pandas for the rest of the pipeline.
+        """
+        wanted = self._probe_columns(path)
+        lf = pl.scan_csv(path, try_parse_dates=True)
+        if wanted:
+            lf = lf.select(wanted)
+        return lf.collect(engine='streaming').to_pandas()
+
+    def _probe_columns(self, path):
+        """Return the columns to project, or [] to read the file in full.
+
+        Pruning is only safe when the header genuinely matches the Spotify
+        extended streaming history schema; a file that merely shares a few
+        names with it (e.g. the short ``ts,artistName,trackName,skipped``
+        format from the README) must be read whole or the analyzers lose
+        columns they would otherwise use.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            header = f.readline().rstrip('\n').split(',')
+        wanted = [col for col in header if col in USED_COLUMNS]
+        export_names = {'master_metadata_track_name',
+                        'master_metadata_album_artist_name'}
+        if not export_names.issubset(wanted):
+            return []
+        return wanted
+
+    def _read_csv_chunked(self, path, chunksize=1_000_000):
+        """Read the CSV in fixed-size chunks, keeping only the needed columns.
+
+        Bounds the parser's working set to one chunk at a time, so multi-GB
+        exports load on memory-constrained hosts (e.g. Kaggle kernels) where
+        a single-shot pd.read_csv of every column would exhaust RAM.
+        """
+        wanted = self._probe_columns(path)
+        dtypes = {col: 'category' for col in wanted if col in CATEGORICAL_COLUMNS}
+        chunks = pd.read_csv(path, chunksize=chunksize,
+                             usecols=wanted or None, dtype=dtypes or None)
+        df = pd.concat(chunks, ignore_index=True)
+        # concat decays categoricals to object when chunks saw different
+        # category sets, so re-encode after the fact to keep the dictionary
+        # compression on multi-chunk files
+        for col in dtypes:
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+        return df
+
     def preprocess_data(self):
         """Clean and prepare data for analysis."""
         print("🔧 Preprocessing data...")
         
-        # Find and convert datetime column
-        datetime_cols = [col for col in self.df.columns 
-                        if any(term in col.lower() for term in ['time', 'date', 'ts'])]
-        
-        if datetime_cols:
-            time_col = datetime_cols[0]
-            self.df['timestamp'] = pd.to_datetime(self.df[time_col])
-            
-            # Extract time features
-            self.df['hour'] = self.df['timestamp'].dt.hour
-            self.df['day_of_week'] = self.df['timestamp'].dt.day_name()
-            self.df['month'] = self.df['timestamp'].dt.month_name()
-            self.df['year'] = self.df['timestamp'].dt.year
-            self.df['date'] = self.df['timestamp'].dt.date
+        # Find the datetime column: lower-case each name once and stop at the
+        # first match instead of classifying every column
+        cols_lower = {col.lower(): col for col in self.df.columns}
+        time_col = next(
+            (orig for low, orig in cols_lower.items()
+             if any(term in low for term in ('time', 'date', 'ts'))),
+            None)
+
+        if time_col is not None:
+            raw = self.df[time_col]
+            if pd.api.types.is_datetime64_any_dtype(raw):
+                self.df['timestamp'] = raw
+            else:
+                try:
+                    # Spotify exports use one fixed ISO-8601 format; naming it
+                    # takes the vectorized C strptime path instead of per-row
+                    # format inference.
+                    self.df['timestamp'] = pd.to_datetime(
+                        raw, format='%Y-%m-%dT%H:%M:%SZ', utc=True, cache=True)
+                except (ValueError, TypeError):
+                    self.df['timestamp'] = pd.to_datetime(raw, errors='coerce')
+
+            # Extract time features via the integer .dt accessors; the
+            # locale-aware day_name()/month_name() string paths are far slower.
+            ts = self.df['timestamp']
+            self.df['hour'] = ts.dt.hour
+            self.df['year'] = ts.dt.year
+            self.df['date'] = ts.dt.date
+
+            # Cache hour/day/month as bare int8 arrays (-1 marks missing):
+            # the histogram bincounts then stream 1-byte codes instead of
+            # 8-byte ints or name strings, and day/month names are applied
+            # only at reporting time from DAY_NAMES/MONTH_NAMES.
+            self._hour = ts.dt.hour.fillna(-1).to_numpy(dtype='int8')
+            self._dow = ts.dt.dayofweek.fillna(-1).to_numpy(dtype='int8')
+            self._month = (ts.dt.month - 1).fillna(-1).to_numpy(dtype='int8')
+
+            # Integer day index (0 = first calendar day) so daily tallies can
+            # use np.bincount instead of hashing datetime.date objects.
+            day0 = ts.dt.normalize()
+            self._first_day = day0.min()
+            self._day_idx = (day0 - self._first_day).dt.days.dropna().to_numpy('int32')
             
             print(f"⏰ Date range: {self.df['timestamp'].min()} to {self.df['timestamp'].max()}")
         else:
@@ -91,84 +306,230 @@ class SpotifyKnowledgeMapper:
             'master_metadata_album_artist_name': 'artistName',
             'master_metadata_album_album_name': 'albumName'
         }
-        
+
+        columns = set(self.df.columns)
         for old_name, new_name in column_mapping.items():
-            if old_name in self.df.columns:
+            if old_name in columns:
                 self.df[new_name] = self.df[old_name]
-                
+
+        # Dictionary-encode the repetitive string columns: groupby/value_counts
+        # then operate on small integer codes instead of per-row Python string
+        # objects, and the frame's memory footprint drops several-fold.
+        for col in ('artistName', 'albumName', 'trackName'):
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('category')
+
         print("✅ Data preprocessing complete!")
-        
+
+    def _duck(self):
+        """Return a DuckDB connection with the DataFrame registered as 'plays'.
+
+        DuckDB scans the pandas frame zero-copy and runs aggregations on its
+        multithreaded columnar engine. Returns None when duckdb isn't installed
+        so callers can fall back to pandas. Each caller gets its own cursor
+        (with the frame registered on it) so the analyzers can query
+        concurrently.
+        """
+        if duckdb is None or self.df is None:
+            return None
+        with self._lock:
+            if self._con is None:
+                self._con = duckdb.connect()
+        cur = self._con.cursor()
+        cur.register('plays', self.df)
+        return cur
+
+    def _count_distinct(self, col):
+        """Distinct count for a column without building a full hash set.
+
+        Categorical columns answer in O(1) from the dictionary size; otherwise
+        DuckDB's HyperLogLog-based approx_count_distinct runs in one pass with
+        kilobytes of state (its ~1% error is invisible in the rounded summary
+        figures). Only the plain-pandas path falls back to an exact nunique().
+        """
+        series = self.df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return int(series.cat.categories.size)
+        con = self._duck()
+        if con is not None:
+            return int(con.execute(
+                f'SELECT approx_count_distinct("{col}") FROM plays'
+            ).fetchone()[0])
+        return series.nunique()
+
+    # Flush order for the buffered analyzer sections
+    SECTION_ORDER = ('temporal', 'preferences', 'intensity', 'skip')
+
+    def _emit_section(self, name, lines, insights):
+        """Buffer one analyzer's output block (thread-safe)."""
+        with self._lock:
+            self._sections[name] = (lines, insights)
+
+    def _flush_sections(self):
+        """Write all buffered analyzer output in a single stdout call.
+
+        One batched write avoids a stdout lock/flush per print (slow under
+        pipe/Kaggle loggers) and keeps the sections and insights in a stable
+        order even when the analyzers ran concurrently.
+        """
+        with self._lock:
+            out = []
+            for name in self.SECTION_ORDER:
+                lines, insights = self._sections.pop(name, (None, None))
+                if lines:
+                    out.extend(lines)
+                if insights:
+                    self.insights.extend(insights)
+            if out:
+                sys.stdout.write('\n'.join(out) + '\n')
+                sys.stdout.flush()
+
+    def _build_histograms(self):
+        """Compute the temporal histograms once and cache them on self.
+
+        The temporal analyzer and the visualizer need the same hour/day/month
+        histograms and per-date counts; building them in one place means each
+        column is scanned a single time instead of once per call site.
+        """
+        with self._lock:
+            if self._hist is not None:
+                return
+            hist = {}
+            con = self._duck()
+
+            if self._hour is not None:
+                # Single bincount pass per int8 array; names are attached here,
+                # at reporting time, rather than stored per row
+                hist['hour'] = pd.Series(
+                    np.bincount(self._hour[self._hour >= 0], minlength=24),
+                    index=np.arange(24))
+                hist['day_of_week'] = pd.Series(
+                    np.bincount(self._dow[self._dow >= 0], minlength=7),
+                    index=list(DAY_NAMES))
+                hist['month'] = pd.Series(
+                    np.bincount(self._month[self._month >= 0], minlength=12),
+                    index=list(MONTH_NAMES))
+            else:
+                for col in ('hour', 'day_of_week', 'month'):
+                    if col not in self.df.columns:
+                        continue
+                    if con is not None:
+                        hist[col] = con.execute(
+                            f'SELECT "{col}", COUNT(*) AS plays FROM plays GROUP BY 1'
+                        ).df().set_index(col)['plays']
+                    else:
+                        hist[col] = self.df[col].value_counts(sort=False, dropna=False)
+
+            if 'timestamp' in self.df.columns:
+                if con is not None:
+                    # NaT rows from the errors='coerce' fallback must not
+                    # form a phantom day, same as groupby dropping NaN keys
+                    self._daily = con.execute(
+                        'SELECT CAST("timestamp" AS DATE) AS date, COUNT(*) AS plays '
+                        'FROM plays WHERE "timestamp" IS NOT NULL '
+                        'GROUP BY 1 ORDER BY 1'
+                    ).df().set_index('date')['plays']
+                elif self._day_idx is not None:
+                    if self._day_idx.size == 0 or pd.isna(self._first_day):
+                        # every timestamp failed to parse; date_range can't
+                        # anchor on NaT, so report no daily activity at all
+                        self._daily = pd.Series(dtype='int64')
+                    else:
+                        # Contiguous int reduction instead of an object-keyed groupby
+                        counts = np.bincount(self._day_idx)
+                        dates = pd.date_range(self._first_day, periods=counts.size).date
+                        self._daily = pd.Series(counts, index=dates)[counts > 0]
+                else:
+                    # factorize once, then bincount the int codes — no hash
+                    # aggregation over datetime.date objects
+                    codes, dates = pd.factorize(self.df['date'], sort=True)
+                    counts = np.bincount(codes[codes >= 0], minlength=len(dates))
+                    self._daily = pd.Series(counts, index=dates)
+
+            self._hist = hist
+
     def analyze_temporal_patterns(self):
         """Analyze when you listen to music most."""
-        print("\n🕐 ANALYZING TEMPORAL PATTERNS")
-        print("="*50)
-        
-        if 'timestamp' not in self.df.columns:
-            print("⚠️ No timestamp data available for temporal analysis")
+        lines = ["\n🕐 ANALYZING TEMPORAL PATTERNS", "="*50]
+        insights = []
+
+        columns = set(self.df.columns)
+        if 'timestamp' not in columns:
+            lines.append("⚠️ No timestamp data available for temporal analysis")
+            self._emit_section('temporal', lines, insights)
             return {}
-            
+
         patterns = {}
-        
+
+        self._build_histograms()
+
         # Peak listening hour
-        if 'hour' in self.df.columns:
-            hourly_counts = self.df['hour'].value_counts().sort_index()
-            peak_hour = hourly_counts.idxmax()
+        if 'hour' in self._hist:
+            peak_hour = self._hist['hour'].idxmax()
             patterns['peak_hour'] = peak_hour
             
             # Classify listening personality
-            if 5 <= peak_hour < 12:
-                patterns['temporal_personality'] = "Morning music person"
-                patterns['personality_emoji'] = "🌅"
-            elif 12 <= peak_hour < 17:
-                patterns['temporal_personality'] = "Afternoon listener"
-                patterns['personality_emoji'] = "☀️"
-            elif 17 <= peak_hour < 22:
-                patterns['temporal_personality'] = "Evening music lover"
-                patterns['personality_emoji'] = "🌆"
-            else:
-                patterns['temporal_personality'] = "Night owl listener"
-                patterns['personality_emoji'] = "🌙"
-                
-            print(f"{patterns['personality_emoji']} You're a {patterns['temporal_personality']} (peak at {peak_hour}:00)")
-            self.insights.append(f"{patterns['personality_emoji']} You're a {patterns['temporal_personality']} (peak at {peak_hour}:00)")
-            
+            patterns['temporal_personality'], patterns['personality_emoji'] = \
+                HOUR_PERSONALITY[peak_hour]
+
+            msg = f"{patterns['personality_emoji']} You're a {patterns['temporal_personality']} (peak at {peak_hour}:00)"
+            lines.append(msg)
+            insights.append(msg)
+
         # Peak listening day
-        if 'day_of_week' in self.df.columns:
-            daily_counts = self.df['day_of_week'].value_counts()
-            peak_day = daily_counts.idxmax()
+        if 'day_of_week' in self._hist:
+            peak_day = self._hist['day_of_week'].idxmax()
             patterns['peak_day'] = peak_day
-            print(f"📅 {peak_day} is your biggest music day")
-            self.insights.append(f"📅 {peak_day} is your biggest music day")
-            
+            msg = f"📅 {peak_day} is your biggest music day"
+            lines.append(msg)
+            insights.append(msg)
+
+        self._emit_section('temporal', lines, insights)
         return patterns
         
     def analyze_music_preferences(self):
         """Analyze your music taste and preferences."""
-        print("\n🎵 ANALYZING MUSIC PREFERENCES")
-        print("="*50)
-        
+        lines = ["\n🎵 ANALYZING MUSIC PREFERENCES", "="*50]
+        insights = []
+
         preferences = {}
-        
+
+        n = len(self.df)
+
         # Top artists analysis
         if 'artistName' in self.df.columns:
-            artist_counts = self.df['artistName'].value_counts()
-            top_artist = artist_counts.index[0]
-            top_artist_plays = artist_counts.iloc[0]
-            artist_percentage = (top_artist_plays / len(self.df)) * 100
+            con = self._duck()
+            if con is not None:
+                # Match pandas value_counts(): NULL artists don't form a group
+                artist_counts = con.execute(
+                    'SELECT "artistName", COUNT(*) AS plays FROM plays '
+                    'WHERE "artistName" IS NOT NULL GROUP BY 1'
+                ).df().set_index('artistName')['plays']
+            else:
+                artist_counts = self.df['artistName'].value_counts(sort=False)
+
+            # argmax + np.partition below only need a partial order, so the
+            # counts are left unsorted — no O(N log N) sort over all artists.
+            counts = artist_counts.to_numpy()
+            top_idx = counts.argmax()
+            top_artist = artist_counts.index[top_idx]
+            top_artist_plays = counts[top_idx]
+            artist_percentage = (top_artist_plays / n) * 100
             
             preferences['top_artist'] = top_artist
             preferences['top_artist_percentage'] = artist_percentage
             
-            print(f"⭐ Your #1 artist: {top_artist} ({top_artist_plays} plays, {artist_percentage:.1f}%)")
-            self.insights.append(f"⭐ {top_artist} dominates your playlist ({artist_percentage:.1f}% of all listening)")
+            lines.append(f"⭐ Your #1 artist: {top_artist} ({top_artist_plays} plays, {artist_percentage:.1f}%)")
+            insights.append(f"⭐ {top_artist} dominates your playlist ({artist_percentage:.1f}% of all listening)")
             
             # Music diversity analysis
-            total_artists = self.df['artistName'].nunique()
-            total_plays = len(self.df)
+            total_artists = len(artist_counts)
+            total_plays = n
             
-            # Calculate concentration ratio (top 10% of artists)
-            top_10_percent = max(1, int(len(artist_counts) * 0.1))
-            top_artists_plays = artist_counts.head(top_10_percent).sum()
+            # Calculate concentration ratio (top 10% of artists) via
+            # introselect — O(N) instead of sorting every artist's count
+            top_10_percent = max(1, int(counts.size * 0.1))
+            top_artists_plays = np.partition(counts, -top_10_percent)[-top_10_percent:].sum()
             concentration_ratio = (top_artists_plays / total_plays) * 100
             
             preferences['diversity_score'] = 100 - concentration_ratio
@@ -176,31 +537,34 @@ class SpotifyKnowledgeMapper:
             
             # Classify music exploration behavior
             if concentration_ratio > 80:
-                exploration_type = "Comfort Zone listener - you love your favorites!"
+                exploration_name, exploration_desc = "Comfort Zone listener", "you love your favorites!"
                 exploration_emoji = "🏠"
             elif concentration_ratio > 60:
-                exploration_type = "Balanced listener - mix of favorites and exploration!"
+                exploration_name, exploration_desc = "Balanced listener", "mix of favorites and exploration!"
                 exploration_emoji = "⚖️"
             else:
-                exploration_type = "Explorer - always discovering new music!"
+                exploration_name, exploration_desc = "Explorer", "always discovering new music!"
                 exploration_emoji = "🗺️"
-                
+
+            exploration_type = f"{exploration_name} - {exploration_desc}"
             preferences['exploration_type'] = exploration_type
-            print(f"{exploration_emoji} You're a {exploration_type}")
-            self.insights.append(f"📊 You're an '{exploration_type.split(' -')[0]}' - {exploration_type.split('- ')[1]}")
-            
+            lines.append(f"{exploration_emoji} You're a {exploration_type}")
+            insights.append(f"📊 You're an '{exploration_name}' - {exploration_desc}")
+
+        self._emit_section('preferences', lines, insights)
         return preferences
         
     def analyze_listening_intensity(self):
         """Analyze how much and how intensively you listen."""
-        print("\n🎧 ANALYZING LISTENING INTENSITY")
-        print("="*50)
-        
+        lines = ["\n🎧 ANALYZING LISTENING INTENSITY", "="*50]
+        insights = []
+
         intensity = {}
-        
+
         if 'timestamp' in self.df.columns:
             # Calculate daily averages
-            daily_counts = self.df.groupby('date').size()
+            self._build_histograms()
+            daily_counts = self._daily
             avg_daily_plays = daily_counts.mean()
             max_daily_plays = daily_counts.max()
             
@@ -208,66 +572,98 @@ class SpotifyKnowledgeMapper:
             intensity['max_daily_plays'] = max_daily_plays
             
             # Classify listening intensity
-            if avg_daily_plays > 50:
-                intensity_type = "heavy listener"
-                intensity_emoji = "🎧"
-            elif avg_daily_plays > 20:
-                intensity_type = "moderate listener"
-                intensity_emoji = "🎵"
-            else:
-                intensity_type = "selective listener"
-                intensity_emoji = "🎶"
-                
+            intensity_type, intensity_emoji = INTENSITY_LEVELS[
+                bisect.bisect_left(INTENSITY_THRESHOLDS, avg_daily_plays)]
+
             intensity['intensity_type'] = intensity_type
-            print(f"{intensity_emoji} You're a {intensity_type} ({avg_daily_plays:.0f} songs/day average)")
-            self.insights.append(f"{intensity_emoji} You're a {intensity_type} ({avg_daily_plays:.0f} songs/day average)")
-            
+            msg = f"{intensity_emoji} You're a {intensity_type} ({avg_daily_plays:.0f} songs/day average)"
+            lines.append(msg)
+            insights.append(msg)
+
             # Calculate total listening time (rough estimate)
             total_days = (self.df['timestamp'].max() - self.df['timestamp'].min()).days
             if total_days > 0:
                 intensity['total_days'] = total_days
                 intensity['total_plays'] = len(self.df)
-                
+
+        self._emit_section('intensity', lines, insights)
         return intensity
         
     def analyze_skip_behavior(self):
         """Analyze skip patterns if available."""
-        print("\n🚫 ANALYZING SKIP BEHAVIOR")
-        print("="*50)
-        
+        lines = ["\n🚫 ANALYZING SKIP BEHAVIOR", "="*50]
+        insights = []
+
         skip_cols = ['skipped', 'skip', 'reason_end', 'reason_start']
         skip_col = None
-        
+
+        columns = set(self.df.columns)
         for col in skip_cols:
-            if col in self.df.columns:
+            if col in columns:
                 skip_col = col
                 break
-                
+
         if not skip_col:
-            print("⚠️ No skip data available")
+            lines.append("⚠️ No skip data available")
+            self._emit_section('skip', lines, insights)
             return {}
-            
+
         skip_analysis = {}
-        
+        n = len(self.df)
+        skips = self.df[skip_col]
+        con = self._duck()
+        is_bool = pd.api.types.is_bool_dtype(skips)
+        skip_expr = (f'"{skip_col}" = TRUE' if is_bool
+                     else f'"{skip_col}" IN (\'SKIP\', \'skip\', \'skipped\')')
+
         # Overall skip rate
-        if self.df[skip_col].dtype == bool:
-            skip_rate = (self.df[skip_col].sum() / len(self.df)) * 100
+        if con is not None:
+            skip_rate = con.execute(
+                f"SELECT 100.0 * SUM(CASE WHEN {skip_expr} THEN 1 ELSE 0 END) / COUNT(*) FROM plays"
+            ).fetchone()[0]
+        elif is_bool:
+            skip_rate = (skips.sum() / n) * 100
         else:
             # Handle different skip indicators
             skip_indicators = ['SKIP', 'skip', True, 'skipped']
-            skip_count = self.df[skip_col].isin(skip_indicators).sum()
-            skip_rate = (skip_count / len(self.df)) * 100
-            
+            skip_count = skips.isin(skip_indicators).sum()
+            skip_rate = (skip_count / n) * 100
+
         skip_analysis['overall_skip_rate'] = skip_rate
-        print(f"📊 Overall skip rate: {skip_rate:.1f}%")
-        
+        lines.append(f"📊 Overall skip rate: {skip_rate:.1f}%")
+
         # Artist-specific skip analysis
-        if 'artistName' in self.df.columns and skip_rate > 0:
-            artist_skip_stats = self.df.groupby('artistName').agg({
-                skip_col: lambda x: (x == True).sum() if x.dtype == bool else x.isin(['SKIP', 'skip', True, 'skipped']).sum(),
-                'artistName': 'count'
-            }).rename(columns={'artistName': 'total_plays'})
-            
+        if 'artistName' in columns and skip_rate > 0:
+            if con is not None:
+                artist_skip_stats = con.execute(
+                    f'SELECT "artistName", SUM(CASE WHEN {skip_expr} THEN 1 ELSE 0 END) AS "{skip_col}", '
+                    f'COUNT(*) AS total_plays FROM plays '
+                    f'WHERE "artistName" IS NOT NULL GROUP BY 1'
+                ).df().set_index('artistName')
+            else:
+                # Reduce over integer codes: the skip indicator collapses to a
+                # single np.isin pass over the category codes, and the
+                # per-artist rollup to two bincounts — no hash aggregation and
+                # no per-group Python at all.
+                if is_bool:
+                    is_skip = skips.fillna(False).to_numpy(dtype=bool)
+                else:
+                    cat = skips.astype('category')
+                    skip_codes = np.flatnonzero(
+                        cat.cat.categories.isin(['SKIP', 'skip', True, 'skipped']))
+                    is_skip = np.isin(cat.cat.codes.to_numpy(), skip_codes)
+
+                artists = self.df['artistName'].astype('category')
+                codes = artists.cat.codes.to_numpy()
+                valid = codes >= 0
+                n_artists = len(artists.cat.categories)
+                totals = np.bincount(codes[valid], minlength=n_artists)
+                skip_sums = np.bincount(codes[valid], weights=is_skip[valid],
+                                        minlength=n_artists).astype(np.int64)
+                artist_skip_stats = pd.DataFrame(
+                    {skip_col: skip_sums, 'total_plays': totals},
+                    index=pd.Index(artists.cat.categories, name='artistName'))
+
             artist_skip_stats['skip_rate'] = (artist_skip_stats[skip_col] / artist_skip_stats['total_plays'] * 100)
             
             # Filter artists with at least 10 plays
@@ -279,14 +675,64 @@ class SpotifyKnowledgeMapper:
                 
                 skip_analysis['most_skipped_artists'] = most_skipped
                 skip_analysis['least_skipped_artists'] = least_skipped
-                
+
+        self._emit_section('skip', lines, insights)
         return skip_analysis
         
     def create_temporal_visualization(self, patterns):
-        """Create temporal pattern visualizations."""
-        if 'hour' not in self.df.columns:
+        """Create temporal pattern visualizations.
+
+        Defaults to a static matplotlib figure: rendering four panels via Agg
+        costs a fraction of the CPU and memory of serializing a multi-MB
+        Plotly figure, which only pays off when someone will actually
+        interact with it (--interactive).
+        """
+        if 'timestamp' not in self.df.columns:
             return None
-            
+
+        self._build_histograms()
+        if 'hour' not in self._hist:
+            return None
+
+        if not self.interactive:
+            return self._create_temporal_matplotlib()
+        return self._create_temporal_plotly()
+
+    def _create_temporal_matplotlib(self):
+        """Render the four temporal panels as a static matplotlib figure."""
+        fig, axes = plt.subplots(2, 2, figsize=(14, 8))
+        fig.suptitle('⏰ Your Music Listening Patterns')
+
+        hourly_counts = self._hist['hour'].sort_index()
+        axes[0, 0].bar(hourly_counts.index, hourly_counts.values, color='#1DB954')
+        axes[0, 0].set_title('🕐 Listening by Hour')
+
+        if 'day_of_week' in self._hist:
+            daily_counts = self._hist['day_of_week'].reindex(DAY_NAMES, fill_value=0)
+            axes[0, 1].bar(range(7), daily_counts.values, color='#1ED760')
+            axes[0, 1].set_xticks(range(7))
+            axes[0, 1].set_xticklabels([day[:3] for day in DAY_NAMES])
+            axes[0, 1].set_title('📅 Listening by Day')
+
+        if 'month' in self._hist:
+            monthly_counts = self._hist['month'].reindex(MONTH_NAMES, fill_value=0)
+            axes[1, 0].bar(range(12), monthly_counts.values, color='#1ED760')
+            axes[1, 0].set_xticks(range(12))
+            axes[1, 0].set_xticklabels([month[:3] for month in MONTH_NAMES])
+            axes[1, 0].set_title('📆 Monthly Patterns')
+
+        if self._daily is not None:
+            # rasterized keeps vector exports small on multi-year histories
+            axes[1, 1].plot(self._daily.index, self._daily.values,
+                            color='#1DB954', linewidth=1.5, rasterized=True)
+            axes[1, 1].set_title('📈 Listening Trend')
+            plt.setp(axes[1, 1].get_xticklabels(), rotation=30, ha='right')
+
+        fig.tight_layout()
+        return fig
+
+    def _create_temporal_plotly(self):
+        """Render the four temporal panels as an interactive Plotly figure."""
         # Create subplots for temporal patterns
         fig = make_subplots(
             rows=2, cols=2,
@@ -297,7 +743,7 @@ class SpotifyKnowledgeMapper:
         )
         
         # Hourly pattern
-        hourly_counts = self.df['hour'].value_counts().sort_index()
+        hourly_counts = self._hist['hour'].sort_index()
         fig.add_trace(go.Bar(
             x=hourly_counts.index, 
             y=hourly_counts.values,
@@ -306,9 +752,8 @@ class SpotifyKnowledgeMapper:
         ), row=1, col=1)
         
         # Daily pattern
-        if 'day_of_week' in self.df.columns:
-            day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            daily_counts = self.df['day_of_week'].value_counts().reindex(day_order, fill_value=0)
+        if 'day_of_week' in self._hist:
+            daily_counts = self._hist['day_of_week'].reindex(DAY_NAMES, fill_value=0)
             fig.add_trace(go.Bar(
                 x=daily_counts.index,
                 y=daily_counts.values,
@@ -317,10 +762,8 @@ class SpotifyKnowledgeMapper:
             ), row=1, col=2)
             
         # Monthly pattern
-        if 'month' in self.df.columns:
-            month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
-            monthly_counts = self.df['month'].value_counts().reindex(month_order, fill_value=0)
+        if 'month' in self._hist:
+            monthly_counts = self._hist['month'].reindex(MONTH_NAMES, fill_value=0)
             fig.add_trace(go.Bar(
                 x=monthly_counts.index,
                 y=monthly_counts.values,
@@ -329,8 +772,8 @@ class SpotifyKnowledgeMapper:
             ), row=2, col=1)
             
         # Daily trend over time
-        if 'date' in self.df.columns:
-            daily_trend = self.df.groupby('date').size().reset_index()
+        if self._daily is not None:
+            daily_trend = self._daily.reset_index()
             daily_trend.columns = ['date', 'plays']
             fig.add_trace(go.Scatter(
                 x=daily_trend['date'],
@@ -360,21 +803,23 @@ class SpotifyKnowledgeMapper:
             print(f"{i:2}. {insight}")
             
         # Summary statistics
+        n = len(self.df)
+        columns = set(self.df.columns)
         print(f"\n📊 SUMMARY STATISTICS:")
-        print(f"   🎵 Total tracks played: {len(self.df):,}")
-        
-        if 'artistName' in self.df.columns:
-            print(f"   🎤 Unique artists discovered: {self.df['artistName'].nunique():,}")
-            
-        if 'timestamp' in self.df.columns:
+        print(f"   🎵 Total tracks played: {n:,}")
+
+        if 'artistName' in columns:
+            print(f"   🎤 Unique artists discovered: {self._count_distinct('artistName'):,}")
+
+        if 'timestamp' in columns:
             days_span = (self.df['timestamp'].max() - self.df['timestamp'].min()).days
             print(f"   📅 Days of listening data: {days_span:,}")
             if days_span > 0:
-                print(f"   📈 Average daily plays: {len(self.df)/days_span:.1f}")
+                print(f"   📈 Average daily plays: {n/days_span:.1f}")
                 
-        if 'trackName' in self.df.columns:
-            unique_tracks = self.df['trackName'].nunique()
-            repeat_ratio = (len(self.df) - unique_tracks) / len(self.df) * 100
+        if 'trackName' in columns:
+            unique_tracks = self._count_distinct('trackName')
+            repeat_ratio = (n - unique_tracks) / n * 100
             print(f"   🔄 Repeat listening rate: {repeat_ratio:.1f}%")
             
         print(f"\n🎉 Your music tells a unique story - these patterns make you who you are!")
@@ -392,18 +837,31 @@ class SpotifyKnowledgeMapper:
             
         self.preprocess_data()
         
-        # Run all analyses
-        temporal_patterns = self.analyze_temporal_patterns()
-        music_preferences = self.analyze_music_preferences()
-        listening_intensity = self.analyze_listening_intensity()
-        skip_behavior = self.analyze_skip_behavior()
+        # Run all analyses concurrently: they only read self.df, and both
+        # pandas and DuckDB release the GIL inside their aggregation kernels,
+        # so the four scans overlap on multi-core hosts.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                'temporal': executor.submit(self.analyze_temporal_patterns),
+                'preferences': executor.submit(self.analyze_music_preferences),
+                'intensity': executor.submit(self.analyze_listening_intensity),
+                'skip': executor.submit(self.analyze_skip_behavior),
+            }
+            results = {name: future.result() for name, future in futures.items()}
+
+        self._flush_sections()
+        temporal_patterns = results['temporal']
         
         # Create visualizations
         if temporal_patterns:
             fig = self.create_temporal_visualization(temporal_patterns)
-            if fig:
-                fig.show()
-                
+            if fig is not None:
+                if self.interactive:
+                    fig.show()
+                else:
+                    fig.savefig('listening_patterns.png', dpi=150, bbox_inches='tight')
+                    print("🖼️ Saved temporal patterns to listening_patterns.png")
+
         # Generate final knowledge map
         self.generate_knowledge_map()
         
@@ -415,6 +873,8 @@ def main():
     parser = argparse.ArgumentParser(description='🎵 Spotify Personal Knowledge Map')
     parser.add_argument('--data', type=str, help='Path to Spotify data CSV file')
     parser.add_argument('--kaggle', action='store_true', help='Run in Kaggle mode')
+    parser.add_argument('--interactive', action='store_true',
+                        help='Render interactive Plotly charts instead of static matplotlib')
     
     args = parser.parse_args()
     
@@ -425,8 +885,9 @@ def main():
         
     # Initialize and run analysis
     analyzer = SpotifyKnowledgeMapper(
-        data_path=args.data, 
-        kaggle_mode=args.kaggle
+        data_path=args.data,
+        kaggle_mode=args.kaggle,
+        interactive=args.interactive
     )
     
     success = analyzer.run_full_analysis()